@@ -5,10 +5,13 @@ This module centralizes the initialization of Flask extensions:
 - CORS (Cross-Origin Resource Sharing)
 - Rate limiting (Flask-Limiter)
 - Logging configuration
+- JSON provider (NumPy-aware serialization)
 """
 
 import logging
+import numpy as np
 from flask import Flask
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
@@ -78,6 +81,35 @@ def init_logging(app: Flask, config) -> None:
     app.logger.info(f"Logging configured with level: {config.LOG_LEVEL}")
 
 
+class NumpyJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider that serializes NumPy arrays and scalars.
+
+    Detectors can return ndarrays directly; they are converted in one
+    C-level tolist() call at response time instead of inside each model.
+    """
+
+    @staticmethod
+    def default(o):
+        if isinstance(o, np.ndarray):
+            return o.tolist()
+        if isinstance(o, np.generic):
+            return o.item()
+        return DefaultJSONProvider.default(o)
+
+
+def init_json_provider(app: Flask) -> None:
+    """
+    Install the NumPy-aware JSON provider.
+
+    Args:
+        app: Flask application instance
+    """
+    app.json = NumpyJSONProvider(app)
+
+    app.logger.info("JSON provider configured with NumPy support")
+
+
 def init_extensions(app: Flask, config) -> None:
     """
     Initialize all Flask extensions.
@@ -89,5 +121,6 @@ def init_extensions(app: Flask, config) -> None:
     init_logging(app, config)
     init_cors(app, config)
     init_limiter(app, config)
+    init_json_provider(app)
 
     app.logger.info("All extensions initialized successfully")
\ No newline at end of file
@@ -5,6 +5,10 @@ import torch
 import librosa
 from pathlib import Path
 import soundfile as sf
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from scipy import signal as scipy_signal
 
 # Performance optimization: Conditional debug logging
 # Only enable verbose logging in development mode
@@ -77,6 +81,471 @@ except Exception as e:
         def __call__(self, *args, **kwargs):
             return []
 
+# Import onnxruntime for the optional CPU inference path
+ONNXRUNTIME_AVAILABLE = False
+
+try:
+    import onnxruntime
+    ONNXRUNTIME_AVAILABLE = True
+except Exception as e:
+    if DEBUG:
+        print(f"Warning: ONNX Runtime import failed: {e}")
+        print("✅ Using PyTorch for CPU inference")
+
+# Import numba for JIT-compiled post-processing kernels
+NUMBA_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except Exception as e:
+    if DEBUG:
+        print(f"Warning: Numba import failed: {e}")
+        print("✅ Using pure-Python post-processing kernels")
+
+    # Fall back to a no-op decorator so the kernels still run as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Beat-Transformer activations are computed at 44.1 kHz with a 1024-sample hop
+_FRAME_RATE = 44100 / 1024  # ~43.066 Hz
+_MIN_DIST_BEAT = int(_FRAME_RATE * 60 / 200)  # Maximum 200 BPM
+_MIN_DIST_DOWNBEAT = int(_FRAME_RATE * 60 / 60)  # At most one downbeat per second
+
+# Long tracks are run through the transformer in chunks of _MAX_CHUNK_FRAMES (~190 s).
+# The 9 dilated attention layers (attn_len=5, dilation 2**layer) see +/-1022 frames,
+# plus a few frames for the convolutional front end, so each chunk carries this much
+# context on both sides and chunked activations match a single full-length pass
+_MAX_CHUNK_FRAMES = 8192
+_CHUNK_CONTEXT_FRAMES = 1088
+
+# 3-tap Gaussian kernel (sigma=0.5) for activation smoothing; the outer taps
+# of scipy's 5-tap kernel are below 3e-4 and are dropped
+_ACTIVATION_SMOOTHING_KERNEL = np.exp(-0.5 * (np.arange(-1, 2) / 0.5) ** 2).astype(np.float32)
+_ACTIVATION_SMOOTHING_KERNEL /= _ACTIVATION_SMOOTHING_KERNEL.sum()
+
+# 5th-order 1 kHz Butterworth low-pass at 44.1 kHz (bass channel of the librosa demixing fallback).
+# float32 sections keep sosfiltfilt in float32 instead of upcasting the waveform to float64
+_LOWPASS_SR = 44100
+_LOWPASS_CUTOFF = 1000
+_LOWPASS_SOS = scipy_signal.butter(
+    5, _LOWPASS_CUTOFF / (_LOWPASS_SR // 2), btype='low', output='sos'
+).astype(np.float32)
+
+# Beats-per-measure groups for time signature detection, indexed by beat count 0..12
+_SIMPLE_METER_MASK = np.array([b >= 2 and b % 2 == 0 and b % 3 != 0 for b in range(13)])
+_COMPOUND_METER_MASK = np.array([b >= 3 and b % 3 == 0 for b in range(13)])
+
+
+@njit(cache=True)
+def _normalize_combined(beat, downbeat, eps, max_sum):
+    """
+    Build the (T, 2) [beat_only, downbeat] activation for the downbeat DBN,
+    where beat_only = max(beat - downbeat, 0).
+
+    Both columns are clamped to [eps, 1 - eps] and rows whose sum reaches
+    max_sum are rescaled to max_sum, in a single pass. Row sums therefore
+    never exceed max_sum + 2 * eps, keeping madmom's log(1 - sum) finite.
+    """
+    num_frames = beat.size
+    combined = np.empty((num_frames, 2), dtype=downbeat.dtype)
+    upper = 1.0 - eps
+    for i in range(num_frames):
+        beat_only = max(beat[i] - downbeat[i], 0.0)
+        beat_value = min(max(beat_only, eps), upper)
+        down = min(max(downbeat[i], eps), upper)
+        total = beat_value + down
+        if total >= max_sum:
+            scale = max_sum / total
+            beat_value = max(beat_value * scale, eps)
+            down = max(down * scale, eps)
+        combined[i, 0] = beat_value
+        combined[i, 1] = down
+    return combined
+
+
+@njit(cache=True, nogil=True)
+def _nb_peak_candidates(signal, height):
+    """
+    Local maxima of `signal` at or above `height`, the first stage of
+    scipy.signal.find_peaks. Flat plateaus resolve to their middle sample.
+
+    Returns:
+        np.ndarray: Candidate peak indices in ascending order (int64)
+    """
+    n = signal.size
+    candidates = np.empty(n // 2 + 1, dtype=np.int64)
+    num_candidates = 0
+    i = 1
+    while i < n - 1:
+        if signal[i - 1] < signal[i]:
+            ahead = i + 1
+            while ahead < n - 1 and signal[ahead] == signal[i]:
+                ahead += 1
+            if signal[ahead] < signal[i]:
+                peak = (i + ahead - 1) // 2
+                if signal[peak] >= height:
+                    candidates[num_candidates] = peak
+                    num_candidates += 1
+                i = ahead
+        i += 1
+    return candidates[:num_candidates]
+
+
+@njit(cache=True, nogil=True)
+def _nb_select_peaks(signal, candidates, order, distance, prominence):
+    """
+    Distance and prominence stages of scipy.signal.find_peaks for the
+    candidates from _nb_peak_candidates. `order` is the argsort of the
+    candidates' heights; higher peaks (later in `order`) win under `distance`.
+
+    Returns:
+        np.ndarray: Indices of the accepted peaks in ascending order (int64)
+    """
+    n = signal.size
+    num_candidates = candidates.size
+
+    # Minimum distance, keeping higher peaks first
+    keep = np.ones(num_candidates, dtype=np.bool_)
+    if distance > 1:
+        for k in range(num_candidates - 1, -1, -1):
+            j = order[k]
+            if not keep[j]:
+                continue
+            left = j - 1
+            while left >= 0 and candidates[j] - candidates[left] < distance:
+                keep[left] = False
+                left -= 1
+            right = j + 1
+            while right < num_candidates and candidates[right] - candidates[j] < distance:
+                keep[right] = False
+                right += 1
+
+    # Prominence, evaluated only for peaks that survived height and distance:
+    # the peak must rise at least `prominence` above the lowest sample on each
+    # side before a strictly higher sample (or the signal edge). Each walk stops
+    # as soon as that depth is reached, and the right side is skipped if the
+    # left one already fails
+    peaks = np.empty(num_candidates, dtype=np.int64)
+    num_peaks = 0
+    for k in range(num_candidates):
+        if not keep[k]:
+            continue
+        peak = candidates[k]
+        value = signal[peak]
+        left_ok = False
+        j = peak
+        while j >= 0 and signal[j] <= value:
+            if value - signal[j] >= prominence:
+                left_ok = True
+                break
+            j -= 1
+        if not left_ok:
+            continue
+        j = peak
+        while j < n and signal[j] <= value:
+            if value - signal[j] >= prominence:
+                peaks[num_peaks] = peak
+                num_peaks += 1
+                break
+            j += 1
+    return peaks[:num_peaks]
+
+
+def _find_peaks(signal, height, distance, prominence):
+    """
+    Equivalent of scipy.signal.find_peaks(signal, height=height,
+    distance=distance, prominence=prominence), returning only the peak indices.
+
+    Candidate search and selection run in JIT kernels that release the GIL.
+    Equal-height peaks that compete under `distance` are ranked with numpy's
+    argsort of the float64 heights, the order scipy uses, so ties resolve the
+    same way.
+
+    Returns:
+        np.ndarray: Indices of the accepted peaks in ascending order (int64)
+    """
+    candidates = _nb_peak_candidates(signal, height)
+    order = np.argsort(signal[candidates].astype(np.float64))
+    return _nb_select_peaks(signal, candidates, order, distance, prominence)
+
+
+@njit(cache=True, nogil=True)
+def _nb_enforce_distance(peaks, distance):
+    """
+    Drop peaks closer than `distance` to an already kept one, for maxima that a
+    (2 * distance + 1)-frame max-pool leaves too close together. Those are always
+    equal-valued. The scan runs right to left and compares each peak with the last
+    kept one, the suppression _find_peaks applies when its argsort keeps the tied
+    peaks in index order (for peaks 0, 8 and 16 with distance 12: 0 and 16).
+
+    Returns:
+        np.ndarray: The kept peak indices in ascending order
+    """
+    keep = np.zeros(peaks.size, dtype=np.bool_)
+    last = 0
+    for k in range(peaks.size - 1, -1, -1):
+        if k == peaks.size - 1 or last - peaks[k] >= distance:
+            keep[k] = True
+            last = peaks[k]
+    return peaks[keep]
+
+
+@njit(cache=True)
+def _count_beats_per_measure(beats, downbeats):
+    """
+    Count the beats falling in each [downbeats[i], downbeats[i + 1]) window.
+
+    Both inputs must be sorted; a single two-pointer pass covers them in
+    O(len(beats) + len(downbeats)) without temporaries.
+    """
+    num_beats = beats.size
+    counts = np.empty(max(downbeats.size - 1, 0), dtype=np.int64)
+    j = 0
+    for i in range(counts.size):
+        while j < num_beats and beats[j] < downbeats[i]:
+            j += 1
+        k = j
+        while k < num_beats and beats[k] < downbeats[i + 1]:
+            k += 1
+        counts[i] = k - j
+        j = k
+    return counts
+
+
+@njit(cache=True, nogil=True)
+def _nb_beat_viterbi(log_densities, om_pointers, first_states, last_states,
+                     tempo_pointers, tempo_prev_states, tempo_log_probs):
+    """
+    Viterbi decoding for the beat tracking HMM of madmom's DBNBeatTrackingProcessor
+    (BeatStateSpace, BeatTransitionModel, RNNBeatTrackingObservationModel).
+
+    Within a beat the state advances deterministically by one; only the first
+    state of each tempo is entered from the last states of the tempi listed in
+    tempo_prev_states[tempo_pointers[t]:tempo_pointers[t + 1]] (CSR layout, with
+    tempo_log_probs as weights). Exploiting that structure replaces the generic
+    sparse transition loop over all states.
+
+    Returns:
+        np.ndarray: Most likely state per frame (empty if no path is possible)
+    """
+    num_frames = log_densities.shape[0]
+    num_states = om_pointers.size
+    num_tempi = first_states.size
+
+    # Tempo of every state; back pointers are only needed for the first state of
+    # each tempo, since every other state is always entered from state - 1
+    state_tempo = np.empty(num_states, dtype=np.int64)
+    for tempo in range(num_tempi):
+        state_tempo[first_states[tempo]:last_states[tempo] + 1] = tempo
+    beat_densities = log_densities[:, 1]
+    no_beat_densities = log_densities[:, 0]
+
+    # Uniform initial distribution
+    previous = np.full(num_states, np.log(1.0 / num_states))
+    current = np.empty(num_states)
+    back_pointers = np.zeros((num_frames, num_tempi), dtype=np.int64)
+
+    for frame in range(num_frames):
+        beat_density = beat_densities[frame]
+        no_beat_density = no_beat_densities[frame]
+        for to_tempo in range(num_tempi):
+            # Beat boundary: best transition from the end of any tempo
+            best = -np.inf
+            for pointer in range(tempo_pointers[to_tempo], tempo_pointers[to_tempo + 1]):
+                prev_state = tempo_prev_states[pointer]
+                candidate = previous[prev_state] + tempo_log_probs[pointer]
+                if candidate > best:
+                    best = candidate
+                    back_pointers[frame, to_tempo] = prev_state
+            state = first_states[to_tempo]
+            current[state] = best + (beat_density if om_pointers[state] else no_beat_density)
+
+            # Inside the beat: advance one state per frame
+            for state in range(first_states[to_tempo] + 1, last_states[to_tempo] + 1):
+                current[state] = previous[state - 1] + (beat_density if om_pointers[state] else no_beat_density)
+        previous, current = current, previous
+
+    state = np.argmax(previous)
+    if previous[state] == -np.inf:
+        return np.empty(0, dtype=np.int64)
+
+    path = np.empty(num_frames, dtype=np.int64)
+    for frame in range(num_frames - 1, -1, -1):
+        path[frame] = state
+        tempo = state_tempo[state]
+        if state == first_states[tempo]:
+            state = back_pointers[frame, tempo]
+        else:
+            state -= 1
+    return path
+
+
+class _NumbaBeatTracker:
+    """
+    Offline drop-in for madmom's DBNBeatTrackingProcessor (linear tempo spacing,
+    correct=True) built on the JIT-compiled _nb_beat_viterbi. Decoding releases
+    the GIL, so it runs in parallel with the downbeat DBN on the detector pool.
+    """
+
+    def __init__(self, min_bpm=55.0, max_bpm=215.0, num_tempi=None, transition_lambda=100,
+                 observation_lambda=16, threshold=0, fps=None):
+        if num_tempi is not None:
+            raise ValueError("_NumbaBeatTracker only models linearly spaced tempi (num_tempi=None)")
+
+        # Beat state space: one state per frame of every integer beat interval
+        intervals = np.arange(np.round(60. * fps / max_bpm), np.round(60. * fps / min_bpm) + 1).astype(np.int64)
+        self.first_states = np.cumsum(np.r_[0, intervals[:-1]]).astype(np.int64)
+        self.last_states = np.cumsum(intervals) - 1
+        state_positions = np.concatenate([np.linspace(0, 1, i, endpoint=False) for i in intervals])
+
+        # Observation model: the first 1/observation_lambda of each beat are beat states
+        self.om_pointers = (state_positions < 1. / observation_lambda).astype(np.int64)
+
+        # Tempo changes at beat boundaries follow an exponential distribution
+        ratio = intervals[np.newaxis, :].astype(np.float64) / intervals[:, np.newaxis].astype(np.float64)
+        prob = np.exp(-float(transition_lambda) * np.abs(ratio - 1.))
+        prob[prob <= np.spacing(1)] = 0
+        prob /= np.sum(prob, axis=1)[:, np.newaxis]
+
+        # Non-zero transitions into each tempo as CSR arrays, ordered by source tempo
+        to_tempo, from_tempo = np.nonzero(prob.T)
+        self.tempo_pointers = np.searchsorted(to_tempo, np.arange(len(intervals) + 1)).astype(np.int64)
+        self.tempo_prev_states = self.last_states[from_tempo]
+        self.tempo_log_probs = np.log(prob[from_tempo, to_tempo])
+
+        self.observation_lambda = observation_lambda
+        self.threshold = threshold
+        self.fps = fps
+
+    def __call__(self, activations):
+        """
+        Detect beats in a beat activation function.
+
+        Returns:
+            np.ndarray: Beat positions in seconds
+        """
+        beats = np.empty(0, dtype=np.int64)
+        first = 0
+
+        # Use only the activations > threshold
+        if self.threshold:
+            idx = np.nonzero(activations >= self.threshold)[0]
+            if idx.any():
+                first = max(first, np.min(idx))
+                last = min(len(activations), np.max(idx) + 1)
+            else:
+                last = first
+            activations = activations[first:last]
+        if not activations.any():
+            return beats / float(self.fps)
+
+        log_densities = np.empty((len(activations), 2), dtype=np.float64)
+        log_densities[:, 0] = np.log((1. - activations) / (self.observation_lambda - 1))
+        log_densities[:, 1] = np.log(activations)
+
+        path = _nb_beat_viterbi(log_densities, self.om_pointers, self.first_states, self.last_states,
+                                self.tempo_pointers, self.tempo_prev_states, self.tempo_log_probs)
+        if path.size == 0:
+            return beats / float(self.fps)
+
+        # Align each beat to the activation peak inside its run of beat states
+        beat_range = self.om_pointers[path]
+        idx = np.nonzero(np.diff(beat_range))[0] + 1
+        if beat_range[0]:
+            idx = np.r_[0, idx]
+        if beat_range[-1]:
+            idx = np.r_[idx, beat_range.size]
+        if idx.any():
+            beats = np.array([np.argmax(activations[left:right]) + left for left, right in idx.reshape((-1, 2))])
+        return (beats + first) / float(self.fps)
+
+
+def _estimate_bpm(beat_times, default=120.0, tolerance=0.15):
+    """
+    Tempo from inter-beat intervals: the mean of the intervals within tolerance
+    of the median interval, so a spurious or missed beat does not skew it.
+    Falls back to the median when no interval is that close, and to default
+    when there are fewer than two beats.
+    """
+    intervals = np.diff(beat_times)
+    if intervals.size == 0:
+        return default
+    median_interval = np.median(intervals)
+    if median_interval <= 0:
+        return default
+    inliers = intervals[np.abs(intervals - median_interval) < tolerance * median_interval]
+    return 60.0 / (inliers.mean() if inliers.size else median_interval)
+
+
+def _extract_downbeat_times(dbn_downbeat_results):
+    """
+    Extract downbeat times from a madmom DBNDownBeatTrackingProcessor result.
+
+    Regular results ((N, 2) [time, beat_number] rows or a flat list of times)
+    are converted once and filtered with a boolean mask. Only ragged
+    structures that cannot be homogenized fall back to per-item parsing.
+
+    Returns:
+        np.ndarray: Downbeat times in seconds (float64)
+    """
+    try:
+        results = np.asarray(dbn_downbeat_results, dtype=np.float64)
+    except (ValueError, TypeError):
+        results = None
+
+    if results is not None:
+        if results.size == 0:
+            return np.array([], dtype=np.float64)
+        if results.ndim == 2 and results.shape[1] >= 2:
+            return results[results[:, 1] == 1, 0]
+        if results.ndim == 1:
+            return results
+        return results.flatten()
+
+    # Ragged result - parse element by element, skipping malformed entries
+    if DEBUG:
+        print(f"DEBUG: Handling non-array madmom result structure")
+    downbeat_times = np.empty(len(dbn_downbeat_results), dtype=np.float64)
+    num_downbeats = 0
+    for item in dbn_downbeat_results:
+        try:
+            if hasattr(item, '__len__') and len(item) >= 2:
+                if item[1] == 1:
+                    downbeat_times[num_downbeats] = float(item[0])
+                    num_downbeats += 1
+            elif isinstance(item, (int, float)):
+                downbeat_times[num_downbeats] = float(item)
+                num_downbeats += 1
+        except (IndexError, ValueError, TypeError) as item_error:
+            if DEBUG:
+                print(f"DEBUG: Skipping problematic item: {item}, error: {item_error}")
+    return downbeat_times[:num_downbeats]
+
+
+@torch.jit.script
+def _fused_peak_mask(signal: torch.Tensor, min_distance: int, height_threshold: float) -> torch.Tensor:
+    """
+    Boolean mask of thresholded local maxima, scripted so the threshold,
+    max-pool and comparisons run as one fused graph instead of separate launches.
+
+    The threshold is max(mean + 0.3 * std, height_threshold). Local maxima are
+    found by dilation over a (2 * min_distance + 1)-frame window, so any two
+    surviving maxima with different values are min_distance apart (max_pool1d
+    pads with -inf, which handles signals shorter than the window).
+    """
+    threshold = torch.clamp(signal.mean() + 0.3 * signal.std(), min=height_threshold)
+    local_max = torch.nn.functional.max_pool1d(
+        signal.view(1, 1, -1),
+        kernel_size=2 * min_distance + 1,
+        stride=1,
+        padding=min_distance
+    ).view(-1)
+    return (signal > threshold) & (signal == local_max)
+
 # Environment detection for GPU control
 def is_local_development():
     """
@@ -347,9 +816,30 @@ class BeatTransformerDetector:
             print(f"Error loading checkpoint {checkpoint_path}: {e}")
             raise
 
-        # Initialize DBN processors
-        self.beat_tracker = DBNBeatTrackingProcessor(
-            min_bpm=55.0, max_bpm=215.0, fps=44100/1024,
+        # Reduced precision for CUDA inference: bf16 weights on GPUs with native bf16
+        # (Ampere, compute capability 8.0+), otherwise fp32 weights under fp16 autocast
+        # (pure fp16 LayerNorm/softmax risks overflow). is_bf16_supported() also reports
+        # emulated bf16 on older GPUs, which Inductor cannot compile kernels for
+        self._model_dtype = torch.float32
+        self._autocast_dtype = None
+        if self.device.type == "cuda":
+            if torch.cuda.get_device_capability(self.device)[0] >= 8:
+                self._model_dtype = torch.bfloat16
+                self.model = self.model.to(dtype=torch.bfloat16)
+            else:
+                self._autocast_dtype = torch.float16
+
+        # Compile the model forward on CUDA (the eager model is kept as a fallback)
+        self._eager_model = None
+        self._compile_model()
+
+        # ONNX Runtime session for CPU inference (None when unavailable)
+        self._onnx_session = self._load_onnx_session(checkpoint_path)
+
+        # Initialize DBN processors (beat decoding uses the JIT Viterbi when Numba is available)
+        beat_tracker_cls = _NumbaBeatTracker if NUMBA_AVAILABLE else DBNBeatTrackingProcessor
+        self.beat_tracker = beat_tracker_cls(
+            min_bpm=55.0, max_bpm=215.0, fps=_FRAME_RATE,
             transition_lambda=100, observation_lambda=6,
             num_tempi=None, threshold=0.2
         )
@@ -357,11 +847,77 @@ class BeatTransformerDetector:
         # Support a wider range of time signatures (2/4, 3/4, 4/4, 5/4, 6/8, 7/8, etc.)
         self.downbeat_tracker = DBNDownBeatTrackingProcessor(
             beats_per_bar=[2, 3, 4, 5, 6, 7, 8, 9, 12], min_bpm=55.0,
-            max_bpm=215.0, fps=44100/1024,
+            max_bpm=215.0, fps=_FRAME_RATE,
             transition_lambda=100, observation_lambda=6,
             num_tempi=None, threshold=0.2
         )
 
+        # Enhanced DBN processors with BALANCED parameters for stability, built once
+        # because madmom precomputes its state spaces and transition models on construction
+        # CRITICAL FIX: The previous parameters were too sensitive and caused instability
+        # observation_lambda=1 was too low, threshold=0.05 was too aggressive
+        if MADMOM_AVAILABLE:
+            self._enhanced_beat_tracker = beat_tracker_cls(
+                min_bpm=55.0, max_bpm=215.0, fps=_FRAME_RATE,
+                transition_lambda=100, observation_lambda=4,  # Balanced sensitivity (between 1 and 6)
+                num_tempi=None, threshold=0.1  # More stable threshold (between 0.05 and 0.2)
+            )
+
+            self._enhanced_downbeat_tracker = DBNDownBeatTrackingProcessor(
+                beats_per_bar=[2, 3, 4, 5, 6, 7, 8, 9, 12], min_bpm=55.0,
+                max_bpm=215.0, fps=_FRAME_RATE,
+                transition_lambda=100, observation_lambda=4,  # Balanced sensitivity
+                num_tempi=None, threshold=0.1  # More stable threshold
+            )
+        else:
+            self._enhanced_beat_tracker = None
+            self._enhanced_downbeat_tracker = None
+
+        # Worker threads so DBN decoding and peak picking overlap
+        self._dbn_executor = ThreadPoolExecutor(max_workers=2)
+
+        # 3-tap moving average for GPU peak detection, created once on the target device
+        self._gpu_smoothing_kernel = torch.ones(1, 1, 3, device=self.device) / 3
+
+        # Pinned host staging buffers for uploads: one per purpose, grown on demand and
+        # shared by all request threads under _pinned_lock (CUDA only)
+        self._pinned_buffers = {}
+        self._pinned_lock = threading.Lock()
+
+        # Cached STFT window and mel filter bank tensors, keyed by parameters and device
+        self._stft_constants = {}
+
+        # Spleeter separator, built on first use (see _get_spleeter_separator)
+        self._spleeter_separator = None
+        self._spleeter_lock = threading.Lock()
+
+    def _compile_model(self):
+        """Compile the Beat Transformer forward with torch.compile on CUDA devices"""
+        if self.device.type != "cuda" or not hasattr(torch, "compile"):
+            return
+
+        # Allow TF32 tensor-core matmuls on Ampere+ GPUs
+        torch.set_float32_matmul_precision('high')
+
+        eager_model = self.model
+        try:
+            # Track lengths vary per song, so compile with dynamic shapes instead of
+            # recompiling (or re-recording CUDA graphs) for every new length
+            self.model = torch.compile(self.model, dynamic=True)
+
+            # Compile at load time instead of on the first request
+            warmup_input = torch.zeros(1, 5, 256, 128, device=self.device, dtype=self._model_dtype)
+            with torch.inference_mode(), torch.autocast(device_type="cuda", dtype=self._autocast_dtype or torch.float16,
+                                                        enabled=self._autocast_dtype is not None):
+                self.model(warmup_input)
+            self._eager_model = eager_model
+            if DEBUG:
+                print("🔧 Beat Transformer forward compiled with torch.compile")
+        except Exception as e:
+            self.model = eager_model
+            if DEBUG:
+                print(f"⚠️  torch.compile unavailable, using eager model: {e}")
+
     def _configure_processing_modes(self):
         """Configure processing modes based on environment detection"""
         is_local = is_local_development()
@@ -580,16 +1136,35 @@ class BeatTransformerDetector:
 
         return info
 
-    def demix_audio_to_spectrogram(self, audio_file, sr=44100, n_fft=4096, n_mels=128, fmin=30, fmax=11000):
+    def _load_audio(self, audio_file, sr=44100):
+        """Decode an audio file once as a (samples, channels) float32 waveform at sr
+
+        Uses Spleeter's AudioAdapter, the decoder the separator has always been fed
+        with, and falls back to librosa when Spleeter is not installed.
+        """
+        try:
+            self._fix_spleeter_click_compatibility()
+            from spleeter.audio.adapter import AudioAdapter
+        except ImportError:
+            y, _ = librosa.load(audio_file, sr=sr, mono=False)
+            return np.atleast_2d(y).T.astype(np.float32, copy=False)
+
+        waveform, _ = AudioAdapter.default().load(audio_file, sample_rate=sr)
+        return waveform.astype(np.float32, copy=False)
+
+    def demix_audio_to_spectrogram(self, audio_file, sr=44100, n_fft=4096, n_mels=128, fmin=30, fmax=11000,
+                                   waveform=None):
         """Enhanced demixing with real Spleeter - now used for both local and production
 
         This method uses real Spleeter 5-stems separation for better beat detection accuracy.
         Librosa fallback is commented out to ensure Spleeter is always used.
+
+        If waveform (as returned by _load_audio at sr) is given, audio_file is not decoded again.
         """
         # CHANGED: Always use Spleeter, no fallback to librosa
         if DEBUG:
             print("🎵 Using real Spleeter 5-stems separation...")
-        return self._demix_with_real_spleeter(audio_file, sr, n_fft, n_mels, fmin, fmax)
+        return self._demix_with_real_spleeter(audio_file, sr, n_fft, n_mels, fmin, fmax, waveform=waveform)
 
         # COMMENTED OUT: Librosa fallback - we now require Spleeter for production
         # if self.use_real_spleeter:
@@ -604,150 +1179,186 @@ class BeatTransformerDetector:
         #     print("🎼 Using librosa-based spectrogram creation (production mode)")
         #     return self._demix_with_librosa_fallback(audio_file, sr, n_fft, n_mels, fmin, fmax)
 
-    def _demix_with_real_spleeter(self, audio_file, sr=44100, n_fft=4096, n_mels=128, fmin=30, fmax=11000):
-        """Real Spleeter-based demixing implementation"""
-        import tempfile
-        import shutil
+    def _mel_spectrogram_db(self, signals, sr=44100, n_fft=4096, n_mels=128, fmin=30, fmax=11000):
+        """Batched log-mel spectrograms, equivalent to running librosa.stft, the mel
+        projection and librosa.power_to_db(ref=np.max) on each channel separately
+
+        Args:
+            signals: (channels, samples) waveforms
 
+        Returns:
+            np.ndarray: (channels, frames, n_mels) float32 spectrograms in dB
+        """
+        # torch.stft on MPS lacks full complex support, so only CUDA is used for the transform
+        device = self.device if self.device.type == "cuda" else torch.device("cpu")
+
+        # Hann window and mel filter bank are built once per parameter set and device
+        key = (device, sr, n_fft, n_mels, fmin, fmax)
+        if key not in self._stft_constants:
+            window = torch.hann_window(n_fft, device=device)
+            # Kept as (n_mels, freq_bins) so the projection multiplies the STFT power as laid out
+            mel_f = librosa.filters.mel(sr=sr, n_fft=n_fft, n_mels=n_mels, fmin=fmin, fmax=fmax)
+            mel_f = torch.from_numpy(mel_f.astype(np.float32, copy=False)).to(device)
+            self._stft_constants[key] = (window, mel_f)
+        window, mel_f = self._stft_constants[key]
+
+        batch = torch.from_numpy(np.ascontiguousarray(signals, dtype=np.float32)).to(device)
+
+        with torch.inference_mode():
+            # One STFT over all channels (librosa defaults: centered frames, zero padding)
+            stft = torch.stft(batch, n_fft=n_fft, hop_length=n_fft // 4, window=window,
+                              center=True, pad_mode='constant', return_complex=True)
+            # |X|^2 as re^2 + im^2 in one real buffer, skipping abs()'s square root
+            stft_power = stft.real.square()
+            stft_power.addcmul_(stft.imag, stft.imag)
+            del stft
+            # Single batched GEMM (n_mels, freq) x (channels, freq, frames), without
+            # transposing the large power tensor
+            spec = torch.matmul(mel_f, stft_power)
+
+            # power_to_db(ref=np.max, amin=1e-10, top_db=80.0) per channel, in place.
+            # Referencing to the channel maximum puts its peak at 0 dB, so the
+            # top_db clipping is a fixed -80 dB floor and needs no second scan
+            ref_db = 10.0 * torch.log10(torch.clamp(spec.amax(dim=(-2, -1), keepdim=True), min=1e-10))
+            spec_db = spec.clamp_(min=1e-10).log10_().mul_(10.0).sub_(ref_db).clamp_(min=-80.0)
+
+        return spec_db.transpose(-1, -2).contiguous().cpu().numpy()
+
+    def _demix_with_real_spleeter(self, audio_file, sr=44100, n_fft=4096, n_mels=128, fmin=30, fmax=11000,
+                                  waveform=None):
+        """Real Spleeter-based demixing implementation"""
         # CRITICAL FIX: Handle click.termui compatibility issue with newer click versions
         self._fix_spleeter_click_compatibility()
 
-        # Import Spleeter components
+        # Fail fast if Spleeter is not importable (the separator itself is built lazily)
         try:
-            from spleeter.separator import Separator
-            from spleeter.audio.adapter import AudioAdapter
+            from spleeter.separator import Separator  # noqa: F401
         except ImportError as e:
             raise ImportError(f"Spleeter not available: {e}")
 
         if DEBUG:
             print(f"🚀 Starting Spleeter GPU-accelerated separation for {audio_file}")
 
-        # Create a temporary directory for processing
-        temp_dir = tempfile.mkdtemp()
+        # Load audio using Spleeter's adapter unless the caller already decoded it
+        if waveform is None:
+            waveform = self._load_audio(audio_file, sr)
+        if DEBUG:
+            print(f"📁 Loaded audio with shape: {waveform.shape}")
 
+        # Separate the audio into 5 stems
+        if DEBUG:
+            print("🎛️  Separating audio with Spleeter...")
         try:
-            # Load audio using Spleeter's adapter
-            audio_loader = AudioAdapter.default()
-            waveform, _ = audio_loader.load(audio_file, sample_rate=sr)
-            if DEBUG:
-                print(f"📁 Loaded audio with shape: {waveform.shape}")
-
-            # Initialize Spleeter for 5-stems demixing
-            # Use local model path to avoid GitHub download issues
-            if DEBUG:
-                print("🔧 Initializing Spleeter 5-stems separator...")
+            # The separator is shared, and Spleeter's TensorFlow predictor is not thread-safe
+            with self._spleeter_lock:
+                demixed = self._get_spleeter_separator().separate(waveform)
+        except Exception as e:
+            # Provide a precise, actionable message about likely root causes
             from pathlib import Path
-            # Note: Spleeter caches to ~/.cache/spleeter/pretrained_models/5stems by default
-            cache_candidates = [
-                Path.home() / ".cache" / "spleeter" / "pretrained_models" / "5stems",
-                Path.home() / ".cache" / "spleeter" / "5stems",  # legacy/misplaced
-            ]
+            details = []
+            default_dir = Path.home() / ".cache" / "spleeter" / "pretrained_models" / "5stems"
+            details.append(f"expected_cache={default_dir} exists={default_dir.exists()}")
+            ckpt = list(default_dir.glob("**/checkpoint")) if default_dir.exists() else []
+            details.append(f"checkpoint_files_found={len(ckpt)}")
+            raise RuntimeError(
+                "Spleeter failed to load its 5-stems model checkpoint. "
+                "This usually means the pretrained model is missing or the cache is corrupt. "
+                f"({' ; '.join(details)})\n"
+                "How to fix: (1) ensure internet so Spleeter can download on first use; "
+                "(2) or pre-download models by running `spleeter separate -p spleeter:5stems -o /tmp/test` once; "
+                "(3) or copy the 5stems model directory into ~/.cache/spleeter/pretrained_models/5stems."
+            ) from e
+        stems = list(demixed.keys())
+        if DEBUG:
+            print(f"✅ Separation complete. Got {len(demixed)} stems: {stems}")
+
+        # Mono stems stacked as (num_stems, samples)
+        stem_audio = np.empty((len(stems), len(demixed[stems[0]])), dtype=np.float32)
+        for i, stem_name in enumerate(stems):
             if DEBUG:
-                print("🔧 Initializing Spleeter 5-stems separator...")
-                print("🔎 Spleeter cache candidates:")
-                for p in cache_candidates:
-                    print(f"   - {p} (exists={p.exists()})")
+                print(f"🎵 Processing stem: {stem_name}")
 
-            # Pre-check: is the default pretrained cache present?
-            default_dir = cache_candidates[0]
-            checkpoint_files = list(default_dir.glob("**/checkpoint")) if default_dir.exists() else []
+            # Convert to mono if stereo
+            audio = demixed[stem_name]
+            stem_audio[i] = np.mean(audio, axis=1) if len(audio.shape) > 1 else audio
 
-            # Try to use local cached model first to avoid GitHub download issues
-            if default_dir.exists() and checkpoint_files:
-                if DEBUG:
-                    print(f"✅ Found Spleeter model in cache: {default_dir}")
-                # Use local model path directly to avoid ModelProvider download
-                separator = Separator(f'spleeter:5stems', multiprocess=False)
-                # Override model_dir to use cached model
-                separator._params['model_dir'] = str(default_dir)
-            else:
-                print("⚠️  Spleeter pretrained 5stems model not found locally; will attempt provider-managed download...")
-                # Let Spleeter manage model discovery/download by default
-                separator = Separator('spleeter:5stems', multiprocess=False)
-
-            # Prefer a bundled local model if present to avoid network/download issues.
-            # IMPORTANT: ModelProvider expects model_dir to be the actual model folder (e.g., '<root>/5stems')
-            local_model_root = (Path(__file__).resolve().parent.parent / 'pretrained_models')
-            local_model_dir = local_model_root / '5stems'
-            if local_model_dir.exists() and (local_model_dir / 'checkpoint').exists():
-                try:
-                    # Create Spleeter probe file so ModelProvider doesn't try to download
-                    probe = local_model_dir / '.probe'
-                    if not probe.exists():
-                        probe.write_text('OK')
-                    separator._params['model_dir'] = str(local_model_dir)
-                    if DEBUG:
-                        print(f"📁 Using bundled Spleeter model at: {local_model_dir}")
-                except Exception as e:
-                    if DEBUG:
-                        print(f"⚠️ Could not set bundled model_dir: {e}")
-            else:
-                # If user cache exists, optionally log it for diagnostics
-                default_dir = cache_candidates[0]
-                if default_dir.exists():
-                    if DEBUG:
-                        print(f"📁 Using default Spleeter cache at: {default_dir}")
+        # Create spectrograms for all stems at once with exact Beat-Transformer parameters
+        # (shape: num_channels x time x mel_bins)
+        result = self._mel_spectrogram_db(stem_audio, sr, n_fft, n_mels, fmin, fmax)
 
-            # Separate the audio into 5 stems
-            if DEBUG:
-                print("🎛️  Separating audio with Spleeter...")
-            try:
-                demixed = separator.separate(waveform)
-            except Exception as e:
-                # Provide a precise, actionable message about likely root causes
-                from pathlib import Path
-                details = []
-                default_dir = Path.home() / ".cache" / "spleeter" / "pretrained_models" / "5stems"
-                details.append(f"expected_cache={default_dir} exists={default_dir.exists()}")
-                ckpt = list(default_dir.glob("**/checkpoint")) if default_dir.exists() else []
-                details.append(f"checkpoint_files_found={len(ckpt)}")
-                raise RuntimeError(
-                    "Spleeter failed to load its 5-stems model checkpoint. "
-                    "This usually means the pretrained model is missing or the cache is corrupt. "
-                    f"({' ; '.join(details)})\n"
-                    "How to fix: (1) ensure internet so Spleeter can download on first use; "
-                    "(2) or pre-download models by running `spleeter separate -p spleeter:5stems -o /tmp/test` once; "
-                    "(3) or copy the 5stems model directory into ~/.cache/spleeter/pretrained_models/5stems."
-                ) from e
-            stems = list(demixed.keys())
-            if DEBUG:
-                print(f"✅ Separation complete. Got {len(demixed)} stems: {stems}")
+        if DEBUG:
+            print(f"🎯 Real Spleeter processing complete. Output shape: {result.shape}")
 
-            # Create Mel filter bank
-            mel_f = librosa.filters.mel(sr=sr, n_fft=n_fft, n_mels=n_mels, fmin=fmin, fmax=fmax).T
+        return result
 
-            # Process each stem to create spectrograms
-            spectrograms = []
-            for stem_name in stems:
-                if DEBUG:
-                    print(f"🎵 Processing stem: {stem_name}")
+    def _get_spleeter_separator(self):
+        """Build the Spleeter 5-stems separator on first use and reuse it afterwards, so
+        its TensorFlow graph and checkpoint are loaded once per detector instead of per call"""
+        if self._spleeter_separator is not None:
+            return self._spleeter_separator
 
-                # Get the separated audio for this stem
-                stem_audio = demixed[stem_name]
+        from spleeter.separator import Separator
 
-                # Convert to mono if stereo
-                if len(stem_audio.shape) > 1:
-                    stem_audio = np.mean(stem_audio, axis=1)
+        # Initialize Spleeter for 5-stems demixing
+        # Use local model path to avoid GitHub download issues
+        if DEBUG:
+            print("🔧 Initializing Spleeter 5-stems separator...")
+        # Note: Spleeter caches to ~/.cache/spleeter/pretrained_models/5stems by default
+        cache_candidates = [
+            Path.home() / ".cache" / "spleeter" / "pretrained_models" / "5stems",
+            Path.home() / ".cache" / "spleeter" / "5stems",  # legacy/misplaced
+        ]
+        if DEBUG:
+            print("🔧 Initializing Spleeter 5-stems separator...")
+            print("🔎 Spleeter cache candidates:")
+            for p in cache_candidates:
+                print(f"   - {p} (exists={p.exists()})")
 
-                # Create spectrogram using librosa with exact Beat-Transformer parameters
-                stft = librosa.stft(stem_audio, n_fft=n_fft, hop_length=n_fft//4)
-                stft_power = np.abs(stft)**2
-                spec = np.dot(stft_power.T, mel_f)
-                spec_db = librosa.power_to_db(spec, ref=np.max)
-                spectrograms.append(spec_db)
+        # Pre-check: is the default pretrained cache present?
+        default_dir = cache_candidates[0]
+        checkpoint_files = list(default_dir.glob("**/checkpoint")) if default_dir.exists() else []
 
-            # Stack all stem spectrograms (shape: num_channels x time x mel_bins)
-            result = np.stack(spectrograms, axis=0)
+        # Try to use local cached model first to avoid GitHub download issues
+        if default_dir.exists() and checkpoint_files:
             if DEBUG:
-                print(f"🎯 Real Spleeter processing complete. Output shape: {result.shape}")
-
-            return result
+                print(f"✅ Found Spleeter model in cache: {default_dir}")
+            # Use local model path directly to avoid ModelProvider download
+            separator = Separator(f'spleeter:5stems', multiprocess=False)
+            # Override model_dir to use cached model
+            separator._params['model_dir'] = str(default_dir)
+        else:
+            print("⚠️  Spleeter pretrained 5stems model not found locally; will attempt provider-managed download...")
+            # Let Spleeter manage model discovery/download by default
+            separator = Separator('spleeter:5stems', multiprocess=False)
+
+        # Prefer a bundled local model if present to avoid network/download issues.
+        # IMPORTANT: ModelProvider expects model_dir to be the actual model folder (e.g., '<root>/5stems')
+        local_model_root = (Path(__file__).resolve().parent.parent / 'pretrained_models')
+        local_model_dir = local_model_root / '5stems'
+        if local_model_dir.exists() and (local_model_dir / 'checkpoint').exists():
+            try:
+                # Create Spleeter probe file so ModelProvider doesn't try to download
+                probe = local_model_dir / '.probe'
+                if not probe.exists():
+                    probe.write_text('OK')
+                separator._params['model_dir'] = str(local_model_dir)
+                if DEBUG:
+                    print(f"📁 Using bundled Spleeter model at: {local_model_dir}")
+            except Exception as e:
+                if DEBUG:
+                    print(f"⚠️ Could not set bundled model_dir: {e}")
+        else:
+            # If user cache exists, optionally log it for diagnostics
+            default_dir = cache_candidates[0]
+            if default_dir.exists():
+                if DEBUG:
+                    print(f"📁 Using default Spleeter cache at: {default_dir}")
 
-        finally:
-            # Clean up temporary directory
-            shutil.rmtree(temp_dir, ignore_errors=True)
+        self._spleeter_separator = separator
+        return separator
 
-    def _demix_with_librosa_fallback(self, audio_file, sr=44100, n_fft=4096, n_mels=128, fmin=30, fmax=11000):
+    def _demix_with_librosa_fallback(self, audio_file, sr=44100, n_fft=4096, n_mels=128, fmin=30, fmax=11000,
+                                     waveform=None):
         """Fallback librosa-based approach (original implementation)
 
         Creates 5 different spectrograms from the same audio with different processing
@@ -756,61 +1367,36 @@ class BeatTransformerDetector:
         if DEBUG:
             print("🎼 Using librosa-based audio processing...")
 
-        # Load audio using librosa
-        y, _ = librosa.load(audio_file, sr=sr, mono=True)
-
-        # Create Mel filter bank
-        mel_f = librosa.filters.mel(sr=sr, n_fft=n_fft, n_mels=n_mels, fmin=fmin, fmax=fmax).T
-        spectrograms = []
+        # Load audio using librosa unless the caller already decoded it
+        if waveform is None:
+            y, _ = librosa.load(audio_file, sr=sr, mono=True)
+        else:
+            y = waveform.mean(axis=1)
+        y = y.astype(np.float32, copy=False)
 
-        # Create 5 different spectrograms to simulate 5-stem separation
+        # Create 5 different signals to simulate 5-stem separation
         # Each with different processing to emphasize different aspects
+        channels = np.empty((5, len(y)), dtype=np.float32)
 
         # 1. Original audio (vocals + instruments)
-        stft = librosa.stft(y, n_fft=n_fft, hop_length=n_fft//4)
-        stft_power = np.abs(stft)**2
-        spec = np.dot(stft_power.T, mel_f)
-        spec_db = librosa.power_to_db(spec, ref=np.max)
-        spectrograms.append(spec_db)
+        channels[0] = y
 
         # 2. High-pass filtered (emphasize drums/percussion)
-        y_highpass = librosa.effects.preemphasis(y, coef=0.97)
-        stft = librosa.stft(y_highpass, n_fft=n_fft, hop_length=n_fft//4)
-        stft_power = np.abs(stft)**2
-        spec = np.dot(stft_power.T, mel_f)
-        spec_db = librosa.power_to_db(spec, ref=np.max)
-        spectrograms.append(spec_db)
-
-        # 3. Percussive component (emphasize drums)
-        y_percussive = librosa.effects.percussive(y, margin=3.0)
-        stft = librosa.stft(y_percussive, n_fft=n_fft, hop_length=n_fft//4)
-        stft_power = np.abs(stft)**2
-        spec = np.dot(stft_power.T, mel_f)
-        spec_db = librosa.power_to_db(spec, ref=np.max)
-        spectrograms.append(spec_db)
-
-        # 4. Harmonic component (emphasize bass/other instruments)
-        y_harmonic = librosa.effects.harmonic(y, margin=3.0)
-        stft = librosa.stft(y_harmonic, n_fft=n_fft, hop_length=n_fft//4)
-        stft_power = np.abs(stft)**2
-        spec = np.dot(stft_power.T, mel_f)
-        spec_db = librosa.power_to_db(spec, ref=np.max)
-        spectrograms.append(spec_db)
+        channels[1] = librosa.effects.preemphasis(y, coef=0.97)
+
+        # 3. Percussive component (emphasize drums) and
+        # 4. Harmonic component (emphasize bass/other instruments) from a single HPSS
+        channels[3], channels[2] = librosa.effects.hpss(y, margin=3.0)
 
         # 5. Low-pass filtered (emphasize bass)
-        from scipy import signal
-        nyquist = sr // 2
-        low_cutoff = 1000  # 1kHz cutoff
-        b, a = signal.butter(5, low_cutoff / nyquist, btype='low')
-        y_lowpass = signal.filtfilt(b, a, y)
-        stft = librosa.stft(y_lowpass, n_fft=n_fft, hop_length=n_fft//4)
-        stft_power = np.abs(stft)**2
-        spec = np.dot(stft_power.T, mel_f)
-        spec_db = librosa.power_to_db(spec, ref=np.max)
-        spectrograms.append(spec_db)
-
-        # Stack all channel spectrograms (shape: num_channels x time x mel_bins)
-        result = np.stack(spectrograms, axis=0)
+        if sr == _LOWPASS_SR:
+            sos = _LOWPASS_SOS
+        else:
+            sos = scipy_signal.butter(5, _LOWPASS_CUTOFF / (sr // 2), btype='low', output='sos').astype(np.float32)
+        channels[4] = scipy_signal.sosfiltfilt(sos, y)
+
+        # One batched STFT + mel projection for all 5 channels (shape: 5 x time x mel_bins)
+        result = self._mel_spectrogram_db(channels, sr, n_fft, n_mels, fmin, fmax)
         if DEBUG:
             print(f"🎯 Librosa processing complete. Output shape: {result.shape}")
 
@@ -826,43 +1412,45 @@ class BeatTransformerDetector:
             dict: Dictionary containing beat and downbeat information
         """
         try:
-            # Load the audio to get duration and sr
-            audio, sr = librosa.load(audio_file, sr=None)
-            duration = librosa.get_duration(y=audio, sr=sr)
+            # Decode the audio once; the duration and the demixer both use this waveform
+            sr = 44100
+            waveform = self._load_audio(audio_file, sr)
+            duration = waveform.shape[0] / sr
 
             # Step 1: Demix audio and create spectrograms
             if DEBUG:
                 print(f"Demixing audio and creating spectrograms: {audio_file}")
-            demixed_spec = self.demix_audio_to_spectrogram(audio_file)
+            demixed_spec = self.demix_audio_to_spectrogram(audio_file, sr=sr, waveform=waveform)
 
             # Step 2: Prepare input for the model with proper device handling
             if DEBUG:
                 print(f"Preparing model input for device: {self.device}")
-            model_input = torch.from_numpy(demixed_spec).unsqueeze(0)
-
-            # Handle MPS float32 requirement and move to device
-            if self.device.type == "mps":
-                model_input = model_input.float().to(self.device)
+            # Spectrograms are built in float32, which is also what MPS requires
+            if demixed_spec.dtype != np.float32:
+                demixed_spec = demixed_spec.astype(np.float32)
+            if self.device.type == "cuda":
+                # Asynchronous upload from a reusable pinned buffer; the cast to the
+                # model dtype then happens on the device
+                model_input = self._upload_pinned("model_input", demixed_spec)
             else:
-                model_input = model_input.float().to(self.device)
+                model_input = torch.from_numpy(demixed_spec).to(self.device)
+
+            # Model's weight dtype (bf16 on capable CUDA GPUs)
+            model_input = model_input.unsqueeze(0).to(dtype=self._model_dtype)
 
             # Step 3: Run inference with GPU acceleration
             if DEBUG:
                 print(f"Running Beat Transformer inference on {self.device}")
-            with torch.no_grad():
-                # Clear GPU cache if available for memory efficiency
-                if self.device_manager and hasattr(self.device_manager, 'clear_cache'):
-                    self.device_manager.clear_cache()
-
-                activation, _ = self.model(model_input)
+            with torch.inference_mode(), torch.autocast(device_type="cuda", dtype=self._autocast_dtype or torch.float16,
+                                                 enabled=self._autocast_dtype is not None):
+                # The caching allocator keeps its pool between requests; emptying it here
+                # would force a device sync and fresh cudaMallocs on every call
+                activation = self._run_model(model_input)
 
-                # Move results back to CPU for further processing
-                beat_activation = torch.sigmoid(activation[0, :, 0]).detach().cpu().numpy()
-                downbeat_activation = torch.sigmoid(activation[0, :, 1]).detach().cpu().numpy()
-
-                # Clear GPU cache after inference if available
-                if self.device_manager and hasattr(self.device_manager, 'clear_cache'):
-                    self.device_manager.clear_cache()
+                # Sigmoid both streams on the device and move them back to CPU in a single
+                # transfer as contiguous (2, T) rows for further processing
+                activations = torch.sigmoid(activation[0].T).contiguous().cpu().numpy()
+                beat_activation, downbeat_activation = activations
 
             # Step 4: Process with DBN (enhanced for low activations)
             if DEBUG:
@@ -885,41 +1473,43 @@ class BeatTransformerDetector:
                     apply_smoothing: Whether to apply Gaussian smoothing to reduce noise
                     normalize_distribution: Whether to normalize to proper probability distribution
                 """
-                # Start with a copy to avoid modifying original
-                conditioned = activation.copy()
-
-                # Apply light Gaussian smoothing to reduce noise that can cause HMM issues
-                if apply_smoothing and len(conditioned) > 10:
-                    try:
-                        from scipy import ndimage
-                        # Very light smoothing (sigma=0.5) to reduce sharp transitions
-                        conditioned = ndimage.gaussian_filter1d(conditioned, sigma=0.5, mode='reflect')
-                    except ImportError:
-                        # Skip smoothing if scipy not available
-                        pass
+                # Apply light Gaussian smoothing to reduce noise that can cause HMM issues.
+                # Either branch produces a new array, so everything below works in place
+                # without modifying the original
+                if apply_smoothing and len(activation) > 10:
+                    # Very light smoothing (sigma=0.5) to reduce sharp transitions
+                    k_side, k_center = _ACTIVATION_SMOOTHING_KERNEL[0], _ACTIVATION_SMOOTHING_KERNEL[1]
+                    conditioned = np.empty_like(activation)
+                    conditioned[1:-1] = k_side * (activation[:-2] + activation[2:]) + k_center * activation[1:-1]
+                    # Reflect at the boundaries (same as gaussian_filter1d mode='reflect')
+                    conditioned[0] = (k_center + k_side) * activation[0] + k_side * activation[1]
+                    conditioned[-1] = (k_center + k_side) * activation[-1] + k_side * activation[-2]
+                else:
+                    conditioned = activation.copy()
 
                 # CRITICAL FIX: Preserve signal strength while ensuring madmom compatibility
                 if normalize_distribution:
                     # Ensure all values are positive
-                    conditioned = np.maximum(conditioned, epsilon)
+                    np.maximum(conditioned, epsilon, out=conditioned)
 
                     # GENTLE normalization that preserves beat detection capability
                     # Only normalize if the sum would cause issues for madmom (when used in combined arrays)
                     # For individual activations, preserve original strength as much as possible
 
                     # Light scaling only if values are extremely high (>2.0)
-                    if conditioned.max() > 2.0:
+                    peak = conditioned.max()
+                    if peak > 2.0:
                         # Gentle scaling to bring down extreme outliers while preserving relative strengths
-                        conditioned = conditioned / (conditioned.max() / 1.0)
+                        conditioned /= peak
 
                     # NO aggressive sum normalization for individual activations
                     # The sum normalization will be handled later in combined array processing
 
                 # Ensure values are in a safe range for madmom logarithmic calculations
-                conditioned = np.clip(conditioned, epsilon, 1.0 - epsilon)
+                np.clip(conditioned, epsilon, 1.0 - epsilon, out=conditioned)
 
                 # Additional safeguard: ensure no NaN or infinite values
-                conditioned = np.nan_to_num(conditioned, nan=epsilon, posinf=1.0-epsilon, neginf=epsilon)
+                np.nan_to_num(conditioned, copy=False, nan=epsilon, posinf=1.0-epsilon, neginf=epsilon)
 
                 return conditioned
 
@@ -947,8 +1537,8 @@ class BeatTransformerDetector:
                 # GPU-ACCELERATED peak-picking algorithm with PyTorch operations
 
                 # Calculate frame rate and timing parameters
-                frame_rate = 44100 / 1024  # ~43.066 Hz
-                min_distance = int(frame_rate * 60 / 200)  # Minimum 200 BPM
+                frame_rate = _FRAME_RATE
+                min_distance = _MIN_DIST_BEAT
                 if DEBUG:
                     print(f"GPU peak-picking parameters: frame_rate={frame_rate:.3f}Hz, min_distance={min_distance} frames")
 
@@ -969,100 +1559,22 @@ class BeatTransformerDetector:
             else:
                 # Use madmom DBN processors
                 try:
-                    # Create DBN processors with BALANCED parameters for stability
-                    # CRITICAL FIX: The previous parameters were too sensitive and caused instability
-                    # observation_lambda=1 was too low, threshold=0.05 was too aggressive
-                    enhanced_beat_tracker = DBNBeatTrackingProcessor(
-                        min_bpm=55.0, max_bpm=215.0, fps=44100/1024,
-                        transition_lambda=100, observation_lambda=4,  # Balanced sensitivity (between 1 and 6)
-                        num_tempi=None, threshold=0.1  # More stable threshold (between 0.05 and 0.2)
-                    )
-
-                    enhanced_downbeat_tracker = DBNDownBeatTrackingProcessor(
-                        beats_per_bar=[2, 3, 4, 5, 6, 7, 8, 9, 12], min_bpm=55.0,
-                        max_bpm=215.0, fps=44100/1024,
-                        transition_lambda=100, observation_lambda=4,  # Balanced sensitivity
-                        num_tempi=None, threshold=0.1  # More stable threshold
-                    )
+                    # Use the enhanced DBN processors built once in __init__
+                    enhanced_beat_tracker = self._enhanced_beat_tracker
+                    enhanced_downbeat_tracker = self._enhanced_downbeat_tracker
 
                     # Use conditioned activations for beat tracking to avoid mathematical errors
-                    dbn_beat_times = enhanced_beat_tracker(beat_activation_conditioned)
-
-                    # CRITICAL FIX: Validate DBN processor results to prevent array shape errors
-                    if not isinstance(dbn_beat_times, np.ndarray):
-                        dbn_beat_times = np.array(dbn_beat_times)
-                    if dbn_beat_times.size == 0:
-                        dbn_beat_times = np.array([])
-
-                    if DEBUG:
-                        print(f"Enhanced DBN beat tracker returned {len(dbn_beat_times)} beats")
+                    # Run beat tracking in the background while the downbeat input is prepared
+                    beat_future = self._dbn_executor.submit(enhanced_beat_tracker, beat_activation_conditioned)
 
-                    # Combined activation for downbeat tracking with proper probability distribution normalization
-                    beat_only = np.maximum(beat_activation_conditioned - downbeat_activation_conditioned,
-                                         np.zeros(beat_activation_conditioned.shape))
-
-                    # Apply additional conditioning to the beat_only component to avoid zeros
-                    epsilon = 1e-6
-                    beat_only_safe = np.clip(beat_only, epsilon, 1.0 - epsilon)
-
-                    # Create initial combined activation
-                    combined_act_raw = np.concatenate((
-                        beat_only_safe[:, np.newaxis],
-                        downbeat_activation_conditioned[:, np.newaxis]
-                    ), axis=-1)  # (T, 2)
-
-                    # CRITICAL FIX: Robust normalization to ensure row sums < 1.0 for madmom HMM compatibility
+                    # Combined [beat_only, downbeat] activation for downbeat tracking with proper
+                    # probability distribution normalization, built in one pass without temporaries
+                    # CRITICAL FIX: Clamp and renormalise so every row sum stays below 1.0
                     # This prevents divide by zero in madmom's log(1 - sum) calculations
-                    row_sums = np.sum(combined_act_raw, axis=1)
-                    max_sum_allowed = 0.95  # Conservative limit well below 1.0 for safety
-
-                    # Find rows where sum >= max_allowed and normalize them
-                    overflow_mask = row_sums >= max_sum_allowed
-                    if np.any(overflow_mask):
-                        # Normalize overflow rows to sum to max_sum_allowed
-                        normalization_factors = max_sum_allowed / row_sums[overflow_mask]
-                        combined_act_raw[overflow_mask] *= normalization_factors[:, np.newaxis]
-                        if DEBUG:
-                            print(f"Normalized {np.sum(overflow_mask)} rows with sum overflow (max was {row_sums.max():.6f})")
-
-                    # Apply final epsilon clamping after normalization
-                    combined_act = np.clip(combined_act_raw, epsilon, 1.0 - epsilon)
-
-                    # Final validation: ensure no row sum >= 1.0
-                    final_sums = np.sum(combined_act, axis=1)
-                    if np.any(final_sums >= 1.0):
-                        if DEBUG:
-                            print(f"WARNING: {np.sum(final_sums >= 1.0)} rows still have sum >= 1.0, applying emergency normalization")
-                        # Emergency normalization for any remaining problematic rows
-                        emergency_mask = final_sums >= 1.0
-                        combined_act[emergency_mask] = combined_act[emergency_mask] / final_sums[emergency_mask, np.newaxis] * max_sum_allowed
-                        combined_act = np.clip(combined_act, epsilon, 1.0 - epsilon)
-                        final_sums = np.sum(combined_act, axis=1)
-
-                    if DEBUG:
-                        print(f"Final row sum stats: min={final_sums.min():.6f}, max={final_sums.max():.6f}, mean={final_sums.mean():.6f}")
-
-                    # CRITICAL DEBUG: Additional validation to prevent madmom divide by zero
-                    # Check for edge cases that still cause mathematical errors
-                    problematic_rows = final_sums >= 0.999  # Very close to 1.0
-                    near_zero_beat_only = combined_act[:, 0] <= 1e-5  # Very small beat_only values
-                    near_zero_downbeat = combined_act[:, 1] <= 1e-5   # Very small downbeat values
-
-                    if DEBUG:
-                        if np.any(problematic_rows):
-                            print(f"WARNING: {np.sum(problematic_rows)} rows have sums >= 0.999, may cause madmom issues")
-                        if np.any(near_zero_beat_only):
-                            print(f"WARNING: {np.sum(near_zero_beat_only)} rows have near-zero beat_only values")
-                        if np.any(near_zero_downbeat):
-                            print(f"WARNING: {np.sum(near_zero_downbeat)} rows have near-zero downbeat values")
-
-                    # Additional safety: ensure no values are exactly at epsilon boundaries
-                    combined_act = np.clip(combined_act, 2*epsilon, 1.0 - 2*epsilon)
-                    final_sums_safe = np.sum(combined_act, axis=1)
-                    if DEBUG:
-                        print(f"After additional safety clipping: max_sum={final_sums_safe.max():.6f}")
-
+                    combined_act = _normalize_combined(beat_activation_conditioned, downbeat_activation_conditioned,
+                                                       eps=2e-6, max_sum=0.95)
                     if DEBUG:
+                        assert np.all(combined_act.sum(axis=1) < 1.0)
                         print(f"Combined activation shape: {combined_act.shape}, "
                               f"beat_only range: [{combined_act[:, 0].min():.6f}, {combined_act[:, 0].max():.6f}], "
                               f"downbeat range: [{combined_act[:, 1].min():.6f}, {combined_act[:, 1].max():.6f}]")
@@ -1071,7 +1583,8 @@ class BeatTransformerDetector:
                     try:
                         if DEBUG:
                             print(f"🔧 Calling enhanced DBN downbeat tracker with combined_act shape: {combined_act.shape}")
-                        dbn_downbeat_results = enhanced_downbeat_tracker(combined_act)
+                        downbeat_future = self._dbn_executor.submit(enhanced_downbeat_tracker, combined_act)
+                        dbn_downbeat_results = downbeat_future.result()
                         if DEBUG:
                             print(f"✅ Enhanced DBN call completed successfully")
                     except Exception as dbn_call_error:
@@ -1079,6 +1592,17 @@ class BeatTransformerDetector:
                         print(f"❌ Enhanced DBN call failed: {dbn_call_error}")
                         raise dbn_call_error
 
+                    dbn_beat_times = beat_future.result()
+
+                    # CRITICAL FIX: Validate DBN processor results to prevent array shape errors
+                    if not isinstance(dbn_beat_times, np.ndarray):
+                        dbn_beat_times = np.array(dbn_beat_times)
+                    if dbn_beat_times.size == 0:
+                        dbn_beat_times = np.array([])
+
+                    if DEBUG:
+                        print(f"Enhanced DBN beat tracker returned {len(dbn_beat_times)} beats")
+
                     # ENHANCED DEBUG: Investigate madmom result structure to fix inhomogeneous shape error
                     if DEBUG:
                         print(f"🔍 DEBUG: madmom result type: {type(dbn_downbeat_results)}")
@@ -1098,59 +1622,7 @@ class BeatTransformerDetector:
 
                     # ENHANCED VALIDATION: Handle malformed results that cause "inhomogeneous shape" errors
                     try:
-                        # CRITICAL FIX: Don't force conversion to numpy array - handle the raw structure
-                        # The error occurs because madmom returns a complex nested structure that can't be homogenized
-                        if isinstance(dbn_downbeat_results, np.ndarray):
-                            # Already a numpy array - proceed normally
-                            pass
-                        else:
-                            # Complex structure - handle carefully without forcing array conversion
-                            if DEBUG:
-                                print(f"DEBUG: Handling non-array madmom result structure")
-
-                        # ROBUST PROCESSING: Handle complex madmom result structures
-                        dbn_downbeat_times_raw = []
-
-                        if isinstance(dbn_downbeat_results, np.ndarray):
-                            # Standard numpy array processing
-                            if dbn_downbeat_results.size > 0 and dbn_downbeat_results.ndim >= 1:
-                                if dbn_downbeat_results.ndim == 2 and dbn_downbeat_results.shape[1] >= 2:
-                                    # Standard format: filter for downbeats (where second column is 1)
-                                    downbeat_mask = dbn_downbeat_results[:, 1] == 1
-                                    dbn_downbeat_times_raw = dbn_downbeat_results[downbeat_mask][:, 0]
-                                elif dbn_downbeat_results.ndim == 1:
-                                    # Single dimension array - use directly
-                                    dbn_downbeat_times_raw = dbn_downbeat_results
-                                else:
-                                    # Unexpected format - extract first column safely
-                                    dbn_downbeat_times_raw = dbn_downbeat_results.flatten()
-                        else:
-                            # CRITICAL FIX: Handle complex nested structures without forcing array conversion
-                            # Process the raw madmom result structure element by element
-                            try:
-                                if hasattr(dbn_downbeat_results, '__len__') and len(dbn_downbeat_results) > 0:
-                                    # Iterate through the complex structure and extract valid downbeat times
-                                    for item in dbn_downbeat_results:
-                                        try:
-                                            if hasattr(item, '__len__') and len(item) >= 2:
-                                                # Check if this represents a downbeat (second element is 1)
-                                                if len(item) >= 2 and item[1] == 1:
-                                                    dbn_downbeat_times_raw.append(float(item[0]))
-                                            elif isinstance(item, (int, float)):
-                                                # Single time value
-                                                dbn_downbeat_times_raw.append(float(item))
-                                        except (IndexError, ValueError, TypeError) as item_error:
-                                            if DEBUG:
-                                                print(f"DEBUG: Skipping problematic item: {item}, error: {item_error}")
-                                            continue
-                            except Exception as structure_error:
-                                if DEBUG:
-                                    print(f"DEBUG: Complex structure processing failed: {structure_error}")
-                                dbn_downbeat_times_raw = []
-
-                        # Convert final result to numpy array
-                        dbn_downbeat_times_raw = np.array(dbn_downbeat_times_raw)
-
+                        dbn_downbeat_times_raw = _extract_downbeat_times(dbn_downbeat_results)
                     except Exception as array_error:
                         # Keep error logging unconditional
                         print(f"Enhanced DBN downbeat result validation failed: {array_error}")
@@ -1169,58 +1641,13 @@ class BeatTransformerDetector:
                         if DEBUG:
                             print(f"Original DBN beat tracker returned {len(dbn_beat_times)} beats")
 
-                        # Combined activation for fallback downbeat tracking with proper normalization
-                        beat_only = np.maximum(beat_activation_conditioned - downbeat_activation_conditioned,
-                                             np.zeros(beat_activation_conditioned.shape))
-
-                        # Apply additional conditioning to the beat_only component to avoid zeros
-                        epsilon = 1e-6
-                        beat_only_safe = np.clip(beat_only, epsilon, 1.0 - epsilon)
-
-                        # Create initial combined activation
-                        combined_act_raw = np.concatenate((
-                            beat_only_safe[:, np.newaxis],
-                            downbeat_activation_conditioned[:, np.newaxis]
-                        ), axis=-1)  # (T, 2)
-
-                        # CRITICAL FIX: Robust normalization for fallback DBN processing
-                        row_sums = np.sum(combined_act_raw, axis=1)
-                        max_sum_allowed = 0.95  # Conservative limit
-
-                        # Normalize overflow rows
-                        overflow_mask = row_sums >= max_sum_allowed
-                        if np.any(overflow_mask):
-                            normalization_factors = max_sum_allowed / row_sums[overflow_mask]
-                            combined_act_raw[overflow_mask] *= normalization_factors[:, np.newaxis]
-                            if DEBUG:
-                                print(f"Fallback: Normalized {np.sum(overflow_mask)} rows with sum overflow (max was {row_sums.max():.6f})")
-
-                        # Apply final epsilon clamping after normalization
-                        combined_act = np.clip(combined_act_raw, epsilon, 1.0 - epsilon)
-
-                        # Final validation for fallback processing
-                        final_sums = np.sum(combined_act, axis=1)
-                        if np.any(final_sums >= 1.0):
-                            if DEBUG:
-                                print(f"Fallback WARNING: {np.sum(final_sums >= 1.0)} rows still have sum >= 1.0, applying emergency normalization")
-                            emergency_mask = final_sums >= 1.0
-                            combined_act[emergency_mask] = combined_act[emergency_mask] / final_sums[emergency_mask, np.newaxis] * max_sum_allowed
-                            combined_act = np.clip(combined_act, epsilon, 1.0 - epsilon)
-                            final_sums = np.sum(combined_act, axis=1)
-
+                        # Combined activation for fallback downbeat tracking with proper normalization.
+                        # Clamp and renormalise so every row sum stays below 1.0 for madmom's log(1 - sum)
+                        combined_act = _normalize_combined(beat_activation_conditioned,
+                                                           downbeat_activation_conditioned,
+                                                           eps=2e-6, max_sum=0.95)
                         if DEBUG:
-                            print(f"Fallback final row sum stats: min={final_sums.min():.6f}, max={final_sums.max():.6f}")
-
-                        # CRITICAL DEBUG: Additional validation for fallback processing
-                        problematic_rows = final_sums >= 0.999
-                        if DEBUG and np.any(problematic_rows):
-                            print(f"Fallback WARNING: {np.sum(problematic_rows)} rows have sums >= 0.999")
-
-                        # Additional safety for fallback processing
-                        combined_act = np.clip(combined_act, 2*epsilon, 1.0 - 2*epsilon)
-                        final_sums_safe = np.sum(combined_act, axis=1)
-                        if DEBUG:
-                            print(f"Fallback after additional safety: max_sum={final_sums_safe.max():.6f}")
+                            assert np.all(combined_act.sum(axis=1) < 1.0)
 
                         dbn_downbeat_results = self.downbeat_tracker(combined_act)
 
@@ -1228,35 +1655,8 @@ class BeatTransformerDetector:
                         if DEBUG:
                             print(f"Fallback DEBUG: madmom result type: {type(dbn_downbeat_results)}")
 
-                        dbn_downbeat_times_raw = []
-
                         try:
-                            if isinstance(dbn_downbeat_results, np.ndarray):
-                                # Standard numpy array processing
-                                if dbn_downbeat_results.size > 0 and dbn_downbeat_results.ndim >= 1:
-                                    if dbn_downbeat_results.ndim == 2 and dbn_downbeat_results.shape[1] >= 2:
-                                        downbeat_mask = dbn_downbeat_results[:, 1] == 1
-                                        dbn_downbeat_times_raw = dbn_downbeat_results[downbeat_mask][:, 0]
-                                    elif dbn_downbeat_results.ndim == 1:
-                                        dbn_downbeat_times_raw = dbn_downbeat_results
-                                    else:
-                                        dbn_downbeat_times_raw = dbn_downbeat_results.flatten()
-                            else:
-                                # Handle complex nested structures for fallback processing
-                                if hasattr(dbn_downbeat_results, '__len__') and len(dbn_downbeat_results) > 0:
-                                    for item in dbn_downbeat_results:
-                                        try:
-                                            if hasattr(item, '__len__') and len(item) >= 2:
-                                                if len(item) >= 2 and item[1] == 1:
-                                                    dbn_downbeat_times_raw.append(float(item[0]))
-                                            elif isinstance(item, (int, float)):
-                                                dbn_downbeat_times_raw.append(float(item))
-                                        except (IndexError, ValueError, TypeError):
-                                            continue
-
-                            # Convert to numpy array
-                            dbn_downbeat_times_raw = np.array(dbn_downbeat_times_raw)
-
+                            dbn_downbeat_times_raw = _extract_downbeat_times(dbn_downbeat_results)
                         except Exception as fallback_error:
                             # Keep error logging unconditional
                             print(f"Fallback DBN result processing failed: {fallback_error}")
@@ -1272,122 +1672,109 @@ class BeatTransformerDetector:
                             print("Falling back to peak-picking algorithm")
                         algorithm_used = "beat_transformer_fallback_peaks"
                         # Fallback to peak-picking when madmom fails
-                        from scipy import signal as scipy_signal
-
-                        frame_rate = 44100 / 1024
-                        min_distance = int(frame_rate * 60 / 200)
-                        downbeat_min_distance = int(frame_rate * 60 / 60)  # Conservative downbeat distance
-
-                        beat_peaks, _ = scipy_signal.find_peaks(
-                            beat_activation_enhanced,
-                            height=0.3,
-                            distance=min_distance,
-                            prominence=0.1
+                        frame_rate = _FRAME_RATE
+                        min_distance = _MIN_DIST_BEAT
+                        downbeat_min_distance = _MIN_DIST_DOWNBEAT  # Conservative downbeat distance
+
+                        # The peak picker's JIT kernels release the GIL, so beats and downbeats run concurrently
+                        beat_peaks_future = self._dbn_executor.submit(
+                            _find_peaks, beat_activation_enhanced,
+                            0.3, min_distance, 0.1
+                        )
+                        downbeat_peaks_future = self._dbn_executor.submit(
+                            _find_peaks, downbeat_activation_enhanced,
+                            0.4, downbeat_min_distance, 0.2  # Higher threshold and prominence
                         )
-                        dbn_beat_times = beat_peaks / frame_rate
+
+                        dbn_beat_times = beat_peaks_future.result() / frame_rate
                         if DEBUG:
                             print(f"Fallback peak-picking beat tracker found {len(dbn_beat_times)} beats")
 
-                        downbeat_peaks, _ = scipy_signal.find_peaks(
-                            downbeat_activation_enhanced,
-                            height=0.4,  # Higher threshold
-                            distance=downbeat_min_distance,
-                            prominence=0.2  # Higher prominence
-                        )
-                        dbn_downbeat_times_raw = downbeat_peaks / frame_rate
+                        dbn_downbeat_times_raw = downbeat_peaks_future.result() / frame_rate
                         if DEBUG:
                             print(f"Fallback peak-picking downbeat tracker found {len(dbn_downbeat_times_raw)} downbeats")
 
-            # Use the raw downbeats directly (simplified approach)
-            dbn_downbeat_times = dbn_downbeat_times_raw
+            # Use the raw downbeats directly (simplified approach), sorted once as float64
+            # for the membership and measure searches below
+            dbn_downbeat_times = np.sort(np.asarray(dbn_downbeat_times_raw, dtype=np.float64))
+            num_downbeats = len(dbn_downbeat_times)
             if DEBUG:
-                print(f"Using {len(dbn_downbeat_times)} downbeats directly")
+                print(f"Using {num_downbeats} downbeats directly")
 
             # Step 5: Process beats - determine their strength based on activation
             # For each beat time, find nearest frame in the beat activation
-            hop_length = 1024  # Default hop length used in Beat-Transformer
-            frame_rate = sr / hop_length  # Correct frame rate calculation
-            beat_info = []
-
-            for beat_time in dbn_beat_times:
-                frame_idx = int(beat_time * frame_rate)
-                if frame_idx < len(beat_activation):
-                    # Get activation at this frame as strength
-                    strength = float(beat_activation[frame_idx])
-                    # Check if this beat is also a downbeat
-                    is_downbeat = bool(np.any(np.abs(dbn_downbeat_times - beat_time) < 0.05)) if len(dbn_downbeat_times) > 0 else False
-                    beat_info.append({
-                        "time": float(beat_time),
-                        "strength": float(strength),
-                        "is_downbeat": is_downbeat
-                    })
-                else:
-                    # Fallback if frame_idx is out of bounds
-                    is_downbeat = bool(np.any(np.abs(dbn_downbeat_times - beat_time) < 0.05)) if len(dbn_downbeat_times) > 0 else False
-                    beat_info.append({
-                        "time": float(beat_time),
-                        "strength": 0.5,  # Default strength
-                        "is_downbeat": is_downbeat
-                    })
-
-            # Calculate BPM from beat times
-            if len(dbn_beat_times) > 1:
-                # Calculate intervals between beats
-                intervals = np.diff(dbn_beat_times)
-                # Calculate median interval in seconds
-                median_interval = np.median(intervals)
-                # Convert to BPM
-                bpm = 60.0 / median_interval if median_interval > 0 else 120.0
+            frame_rate = _FRAME_RATE  # Activation frame rate, independent of the file's native sample rate
+            beat_times = np.asarray(dbn_beat_times, dtype=np.float64)
+
+            # Get activation at each beat frame as strength (default 0.5 if out of bounds)
+            frame_idx = (beat_times * frame_rate).astype(np.int64)
+            in_bounds = frame_idx < len(beat_activation)
+            strengths = np.full(len(beat_times), 0.5, dtype=np.float32)
+            strengths[in_bounds] = beat_activation[frame_idx[in_bounds]]
+
+            # Check which beats are also downbeats via the nearest downbeat on either side
+            if num_downbeats > 0:
+                pos = np.searchsorted(dbn_downbeat_times, beat_times)
+                right = dbn_downbeat_times[np.minimum(pos, num_downbeats - 1)]
+                left = dbn_downbeat_times[np.maximum(pos - 1, 0)]
+                is_downbeat = np.minimum(np.abs(right - beat_times), np.abs(left - beat_times)) < 0.05
             else:
-                bpm = 120.0  # Default BPM if not enough beats
+                is_downbeat = np.zeros(len(beat_times), dtype=bool)
+
+            # Per-beat records, the documented detect_beats response shape
+            beat_info = [
+                {"time": time, "strength": strength, "is_downbeat": downbeat}
+                for time, strength, downbeat in zip(beat_times.tolist(), strengths.tolist(), is_downbeat.tolist())
+            ]
+
+            # Calculate BPM from beat times (120 BPM if there are not enough beats)
+            bpm = _estimate_bpm(dbn_beat_times)
 
             # Determine time signature by analyzing beats between downbeats
             # Two-stage detection: classify simple vs compound time, then select most common within group
             time_signature = 4  # Default to 4/4
+            denominator = 4
+            time_classification = "default"
             time_signatures = []  # Store time signatures for each measure
 
-            if len(dbn_downbeat_times) >= 2:
-                for i in range(len(dbn_downbeat_times) - 1):
-                    curr_downbeat = dbn_downbeat_times[i]
-                    next_downbeat = dbn_downbeat_times[i + 1]
+            if num_downbeats >= 2:
+                # Count beats in each [downbeat_i, downbeat_i+1) window in one merged pass
+                beats_per_measure = _count_beats_per_measure(beat_times, dbn_downbeat_times)
 
-                    # OPTIMIZATION #3: Vectorize beat counting with NumPy for 10-20% performance gain
-                    beats_in_measure = int(np.sum((dbn_beat_times >= curr_downbeat) & (dbn_beat_times < next_downbeat)))
-
-                    # Only consider reasonable time signatures
-                    if 2 <= beats_in_measure <= 12:
-                        time_signatures.append(beats_in_measure)
+                # Only consider reasonable time signatures
+                time_signatures = beats_per_measure[(beats_per_measure >= 2) & (beats_per_measure <= 12)]
 
                 # Two-stage time signature detection
-                if time_signatures:
-                    from collections import Counter
-
-                    # Count occurrences of each beats-per-measure value
-                    beat_counts = Counter(time_signatures)
+                if len(time_signatures) > 0:
+                    # Count occurrences of each beats-per-measure value (bins 0..12)
+                    beat_counts = np.bincount(time_signatures, minlength=13)
 
                     # Stage 1: Classify simple vs compound time
-                    # Simple time: divisible by 2 but not by 3 (2, 4, 8)
+                    # Simple time: divisible by 2 but not by 3 (2, 4, 8, 10)
                     # Compound time: divisible by 3 (3, 6, 9, 12)
-                    simple_time_measures = sum(count for beats, count in beat_counts.items()
-                                              if beats % 2 == 0 and beats % 3 != 0)
-                    compound_time_measures = sum(count for beats, count in beat_counts.items()
-                                                if beats % 3 == 0)
+                    simple_time_measures = int(beat_counts[_SIMPLE_METER_MASK].sum())
+                    compound_time_measures = int(beat_counts[_COMPOUND_METER_MASK].sum())
+
+                    # Rank bins by count, breaking ties by first appearance in the track
+                    num_measures = len(time_signatures)
+                    first_seen = np.full(13, num_measures)
+                    np.minimum.at(first_seen, time_signatures, np.arange(num_measures))
+                    rank = beat_counts * (num_measures + 1) - first_seen
 
                     # Stage 2: Select most common within the winning group
                     if compound_time_measures > simple_time_measures:
                         # Compound time wins - select most common from 3, 6, 9, 12
-                        compound_beats = {beats: count for beats, count in beat_counts.items() if beats % 3 == 0}
-                        time_signature = max(compound_beats.items(), key=lambda x: x[1])[0]
+                        group = np.flatnonzero(_COMPOUND_METER_MASK)
+                        time_signature = int(group[np.argmax(rank[group])])
                         time_classification = "compound"
                     elif simple_time_measures > compound_time_measures:
-                        # Simple time wins - select most common from 2, 4, 8
-                        simple_beats = {beats: count for beats, count in beat_counts.items()
-                                       if beats % 2 == 0 and beats % 3 != 0}
-                        time_signature = max(simple_beats.items(), key=lambda x: x[1])[0]
+                        # Simple time wins - select most common from 2, 4, 8, 10
+                        group = np.flatnonzero(_SIMPLE_METER_MASK)
+                        time_signature = int(group[np.argmax(rank[group])])
                         time_classification = "simple"
                     else:
                         # Tie - use overall most common (fallback to original behavior)
-                        time_signature = beat_counts.most_common(1)[0][0]
+                        time_signature = int(np.argmax(rank))
                         time_classification = "mixed"
 
                     # Determine denominator based on time signature
@@ -1404,25 +1791,21 @@ class BeatTransformerDetector:
 
                     # OPTIMIZATION #2: Debug-only detailed logging
                     if DEBUG:
-                        print(f"Using {len(dbn_downbeat_times)} downbeats directly")
+                        print(f"Using {num_downbeats} downbeats directly")
                         print(f"Time signatures found in measures: {time_signatures}")
-                        print(f"Beat distribution: {dict(beat_counts)}")
+                        print(f"Beat distribution: { {b: int(c) for b, c in enumerate(beat_counts) if c} }")
                         print(f"Classification: {time_classification} time ({simple_time_measures} simple, {compound_time_measures} compound)")
 
                     # OPTIMIZATION #4: Removed duplicate log statement (was line 1300)
 
-            # Determine denominator if not set (for cases where time_signatures is empty)
-            if 'denominator' not in locals():
-                denominator = 4
-
             return {
                 "success": True,
-                "beats": dbn_beat_times.tolist(),
+                "beats": beat_times,
                 "beat_info": beat_info,
-                "downbeats": dbn_downbeat_times.tolist(),
+                "downbeats": dbn_downbeat_times,
                 "bpm": float(bpm),
                 "total_beats": len(dbn_beat_times),
-                "total_downbeats": len(dbn_downbeat_times),
+                "total_downbeats": num_downbeats,
                 "duration": float(duration),
                 "time_signature": f"{int(time_signature)}/{int(denominator)}",  # Format with correct denominator
                 "model_used": algorithm_used
@@ -1445,45 +1828,158 @@ class BeatTransformerDetector:
                 "model_used": "beat_transformer_error"
             }
 
-    def _gpu_accelerated_peak_detection(self, beat_activation, downbeat_activation, frame_rate, min_distance):
-        """GPU-accelerated peak detection using PyTorch operations"""
-        import torch
+    def _run_model(self, model_input):
+        """Run the transformer on a (1, 5, T, 128) input, in overlapping time chunks for
+        long tracks so peak activation memory is bounded by the chunk size
 
+        Returns:
+            torch.Tensor: (1, T, 2) float32 activation logits
+        """
+        num_frames = model_input.shape[2]
+        if num_frames <= _MAX_CHUNK_FRAMES + 2 * _CHUNK_CONTEXT_FRAMES:
+            return self._forward(model_input).float()
+
+        chunks = []
+        for start in range(0, num_frames, _MAX_CHUNK_FRAMES):
+            end = min(start + _MAX_CHUNK_FRAMES, num_frames)
+            context_start = max(start - _CHUNK_CONTEXT_FRAMES, 0)
+            context_end = min(end + _CHUNK_CONTEXT_FRAMES, num_frames)
+            activation = self._forward(model_input[:, :, context_start:context_end])
+            # Keep only the chunk's core frames
+            chunks.append(activation[:, start - context_start:end - context_start].float())
+        return torch.cat(chunks, dim=1)
+
+    def _forward(self, model_input):
+        """Single model forward returning the activation logits, through ONNX Runtime
+        when a CPU session is loaded and through PyTorch otherwise"""
+        if self._onnx_session is not None:
+            spectrogram = np.ascontiguousarray(model_input.numpy())
+            return torch.from_numpy(self._onnx_session.run(["activation"], {"spectrogram": spectrogram})[0])
         try:
-            # Convert activations to GPU tensors
-            beat_tensor = torch.from_numpy(beat_activation).float().to(self.device)
-            downbeat_tensor = torch.from_numpy(downbeat_activation).float().to(self.device)
+            activation, _ = self.model(model_input)
+        except Exception as e:
+            if self._eager_model is None:
+                raise
+            # Recompiling for a new input shape failed; serve with the eager model from now on
+            if DEBUG:
+                print(f"⚠️  Compiled forward failed, falling back to eager model: {e}")
+            self.model, self._eager_model = self._eager_model, None
+            activation, _ = self.model(model_input)
+        return activation
+
+    def _load_onnx_session(self, checkpoint_path):
+        """Open an ONNX Runtime CPU session for the model, exporting it to the ONNX cache
+        directory the first time (or when the checkpoint is newer than the export)
 
+        The cache directory is BEAT_TRANSFORMER_ONNX_CACHE_DIR, or a directory under the
+        system temp dir, so the model directory can stay read-only. The exported graph
+        is checked against PyTorch at a second length, so an export that traced the time
+        axis as a constant is rejected and deleted.
+
+        Returns:
+            onnxruntime.InferenceSession or None: None off CPU, without onnxruntime,
+            or if the export or check fails (PyTorch is used instead)
+        """
+        if self.device.type != "cpu" or not ONNXRUNTIME_AVAILABLE:
+            return None
+
+        checkpoint_path = Path(checkpoint_path)
+        cache_dir = Path(
+            os.environ.get("BEAT_TRANSFORMER_ONNX_CACHE_DIR")
+            or Path(tempfile.gettempdir()) / "beat_transformer_onnx"
+        )
+        onnx_path = cache_dir / f"{checkpoint_path.stem}.onnx"
+        try:
+            if not onnx_path.exists() or onnx_path.stat().st_mtime < checkpoint_path.stat().st_mtime:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                # Export to a private file and rename, so concurrent workers never read a partial graph
+                tmp_path = onnx_path.with_suffix(f".{os.getpid()}.onnx.tmp")
+                try:
+                    with torch.no_grad():
+                        torch.onnx.export(
+                            self.model, (torch.zeros(1, 5, 256, 128),), str(tmp_path),
+                            input_names=["spectrogram"], output_names=["activation"],
+                            dynamic_axes={"spectrogram": {2: "frames"}, "activation": {1: "frames"}},
+                            opset_version=17, dynamo=False,
+                        )
+                    os.replace(tmp_path, onnx_path)
+                finally:
+                    tmp_path.unlink(missing_ok=True)
+
+            session = onnxruntime.InferenceSession(str(onnx_path), providers=["CPUExecutionProvider"])
+
+            check_input = torch.rand(1, 5, 300, 128)
+            with torch.no_grad():
+                expected, _ = self.model(check_input)
+            actual = session.run(["activation"], {"spectrogram": check_input.numpy()})[0]
+            if actual.shape != tuple(expected.shape) or not np.allclose(actual, expected.numpy(), atol=1e-3):
+                # Delete the rejected graph so the next start exports again instead of reusing it
+                del session
+                onnx_path.unlink(missing_ok=True)
+                raise ValueError("ONNX Runtime output does not match the PyTorch model")
+
+            if DEBUG:
+                print(f"🔧 Using ONNX Runtime for CPU inference: {onnx_path}")
+            return session
+        except Exception as e:
             if DEBUG:
-                print(f"🔥 Processing on {self.device}: beat_tensor.shape={beat_tensor.shape}")
+                print(f"⚠️  ONNX Runtime unavailable for Beat Transformer, using PyTorch: {e}")
+            return None
 
-            # GPU-accelerated smoothing using 1D convolution
-            kernel_size = 3
-            padding = kernel_size // 2
+    def _upload_pinned(self, name, array):
+        """Upload a float32 array to the CUDA device asynchronously through a reusable
+        page-locked host buffer and return the device tensor
 
-            # Create smoothing kernel
-            smooth_kernel = torch.ones(1, 1, kernel_size, device=self.device) / kernel_size
+        There is one flat buffer per name, so pinned memory stays bounded by the largest
+        array staged under each name rather than growing with the number of request
+        threads. A CUDA event recorded after each upload lets the next caller wait until
+        the previous copy out of the buffer has finished before overwriting it.
+        """
+        with self._pinned_lock:
+            buffer, upload_done = self._pinned_buffers.get(name, (None, None))
+            if upload_done is not None:
+                upload_done.synchronize()
+            if buffer is None or buffer.numel() < array.size:
+                buffer = torch.empty(array.size, dtype=torch.float32, pin_memory=True)
+            staged = buffer[:array.size].view(array.shape)
+            staged.copy_(torch.from_numpy(array))
+            uploaded = staged.to(self.device, non_blocking=True)
+            upload_done = torch.cuda.Event()
+            upload_done.record()
+            self._pinned_buffers[name] = (buffer, upload_done)
+        return uploaded
 
-            # Apply smoothing
-            beat_smoothed = torch.nn.functional.conv1d(
-                beat_tensor.unsqueeze(0).unsqueeze(0),
-                smooth_kernel,
-                padding=padding
-            ).squeeze()
+    def _gpu_accelerated_peak_detection(self, beat_activation, downbeat_activation, frame_rate, min_distance):
+        """GPU-accelerated peak detection using PyTorch operations"""
+        import torch
 
-            downbeat_smoothed = torch.nn.functional.conv1d(
-                downbeat_tensor.unsqueeze(0).unsqueeze(0),
-                smooth_kernel,
-                padding=padding
-            ).squeeze()
+        try:
+            # Convert both activations to one (2, 1, T) GPU tensor with a single transfer
+            host_activations = np.stack([beat_activation, downbeat_activation]).astype(np.float32, copy=False)
+            if self.device.type == "cuda":
+                # Kernels on the same stream are ordered and .cpu() below synchronizes
+                activations = self._upload_pinned("activations", host_activations)
+            else:
+                activations = torch.from_numpy(host_activations).to(self.device)
+            activations = activations.unsqueeze(1)
+
+            if DEBUG:
+                print(f"🔥 Processing on {self.device}: activations.shape={activations.shape}")
+
+            # GPU-accelerated smoothing: both streams in one batched 1D convolution
+            smoothed = torch.nn.functional.conv1d(activations, self._gpu_smoothing_kernel, padding=1)
+            beat_smoothed, downbeat_smoothed = smoothed[0, 0], smoothed[1, 0]
 
             # GPU-accelerated peak detection using local maxima
+            downbeat_min_distance = min_distance * 3
             beat_peaks = self._find_peaks_gpu(beat_smoothed, min_distance, height_threshold=0.1)
-            downbeat_peaks = self._find_peaks_gpu(downbeat_smoothed, min_distance * 3, height_threshold=0.2)
+            downbeat_peaks = self._find_peaks_gpu(downbeat_smoothed, downbeat_min_distance, height_threshold=0.2)
 
-            # Convert back to CPU and calculate times
-            beat_times = beat_peaks.cpu().numpy() / frame_rate
-            downbeat_times = downbeat_peaks.cpu().numpy() / frame_rate
+            # Convert back to CPU in a single transfer, then split, drop equal-valued
+            # maxima closer than the minimum distance and calculate times
+            peak_frames = torch.cat([beat_peaks, downbeat_peaks]).cpu().numpy()
+            beat_times = _nb_enforce_distance(peak_frames[:len(beat_peaks)], min_distance) / frame_rate
+            downbeat_times = _nb_enforce_distance(peak_frames[len(beat_peaks):], downbeat_min_distance) / frame_rate
 
             if DEBUG:
                 print(f"✅ GPU peak detection: {len(beat_times)} beats, {len(downbeat_times)} downbeats")
@@ -1496,86 +1992,37 @@ class BeatTransformerDetector:
             return self._cpu_peak_detection(beat_activation, downbeat_activation, frame_rate, min_distance)
 
     def _find_peaks_gpu(self, signal_tensor, min_distance, height_threshold=0.1):
-        """Find peaks in a 1D signal using GPU operations"""
-        import torch
+        """Find candidate peaks in a 1D signal using GPU operations
 
-        # Calculate dynamic threshold
-        signal_mean = torch.mean(signal_tensor)
-        signal_std = torch.std(signal_tensor)
-        threshold = torch.max(signal_mean + 0.3 * signal_std, torch.tensor(height_threshold, device=self.device))
-
-        # Find points above threshold
-        above_threshold = signal_tensor > threshold
-
-        # Find local maxima using dilation
-        kernel_size = min(min_distance * 2 + 1, len(signal_tensor) // 4)
-        if kernel_size % 2 == 0:
-            kernel_size += 1
-
-        padding = kernel_size // 2
-
-        # Use max pooling to find local maxima
-        signal_padded = torch.nn.functional.pad(signal_tensor.unsqueeze(0), (padding, padding), mode='reflect')
-        local_max = torch.nn.functional.max_pool1d(
-            signal_padded.unsqueeze(0),
-            kernel_size=kernel_size,
-            stride=1,
-            padding=0
-        ).squeeze()
-
-        # Points that are both above threshold and local maxima
-        is_peak = above_threshold & (signal_tensor == local_max)
-
-        # Get peak indices
-        peak_indices = torch.nonzero(is_peak, as_tuple=False).squeeze(-1)
-
-        # Apply minimum distance constraint
-        if len(peak_indices) > 1:
-            # Sort by signal strength (descending)
-            peak_values = signal_tensor[peak_indices]
-            sorted_indices = torch.argsort(peak_values, descending=True)
-            sorted_peaks = peak_indices[sorted_indices]
-
-            # Keep peaks with minimum distance
-            kept_peaks = []
-            for peak in sorted_peaks:
-                if len(kept_peaks) == 0:
-                    kept_peaks.append(peak)
-                else:
-                    # Check distance to all kept peaks
-                    distances = torch.abs(torch.stack(kept_peaks) - peak)
-                    if torch.all(distances >= min_distance):
-                        kept_peaks.append(peak)
+        Maxima with different values are at least min_distance apart; equal-valued
+        maxima within min_distance of each other are all returned, for
+        _nb_enforce_distance to thin after the transfer to the CPU.
 
-            peak_indices = torch.stack(kept_peaks) if kept_peaks else torch.tensor([], device=self.device, dtype=torch.long)
+        Returns:
+            torch.Tensor: Peak indices sorted by position
+        """
+        import torch
 
-        return peak_indices
+        # Thresholded local maxima in a single scripted graph
+        is_peak = _fused_peak_mask(signal_tensor, int(min_distance), float(height_threshold))
 
-    def _cpu_peak_detection(self, beat_activation, downbeat_activation, frame_rate, min_distance):
-        """CPU-based peak detection fallback using scipy"""
-        from scipy import signal as scipy_signal
+        return torch.where(is_peak)[0]
 
+    def _cpu_peak_detection(self, beat_activation, downbeat_activation, frame_rate, min_distance):
+        """CPU-based peak detection fallback using the JIT-compiled peak picker (_find_peaks)"""
         if DEBUG:
             print("Using CPU-based peak detection")
 
-        # Beat detection
-        beat_peaks, beat_properties = scipy_signal.find_peaks(
-            beat_activation,
-            height=0.1,
-            distance=min_distance,
-            prominence=0.05
-        )
-        beat_times = beat_peaks / frame_rate
-
-        # Downbeat detection
+        # Beat and downbeat detection run concurrently (the peak picker's JIT kernels release the GIL)
         downbeat_min_distance = int(frame_rate * 60 / 60)  # Minimum 60 BPM for downbeats
-        downbeat_peaks, downbeat_properties = scipy_signal.find_peaks(
-            downbeat_activation,
-            height=0.2,
-            distance=downbeat_min_distance,
-            prominence=0.1
+        beat_peaks_future = self._dbn_executor.submit(
+            _find_peaks, beat_activation, 0.1, min_distance, 0.05
+        )
+        downbeat_peaks_future = self._dbn_executor.submit(
+            _find_peaks, downbeat_activation, 0.2, downbeat_min_distance, 0.1
         )
-        downbeat_times = downbeat_peaks / frame_rate
+        beat_times = beat_peaks_future.result() / frame_rate
+        downbeat_times = downbeat_peaks_future.result() / frame_rate
 
         if DEBUG:
             print(f"✅ CPU peak detection: {len(beat_times)} beats, {len(downbeat_times)} downbeats")
@@ -79,8 +79,8 @@ def get_audio_duration(audio_path: str) -> float:
     """
     try:
         import librosa
-        y, sr = librosa.load(audio_path, sr=None)
-        duration = librosa.get_duration(y=y, sr=sr)
+        # Read the length from the file header instead of decoding the audio
+        duration = librosa.get_duration(path=audio_path)
         return float(duration)
     except Exception as e:
         log_error(f"Failed to get audio duration: {e}")
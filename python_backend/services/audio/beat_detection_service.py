@@ -9,6 +9,7 @@ import os
 import time
 from collections import Counter
 from typing import Dict, Any, List, Optional
+import numpy as np
 from utils.logging import log_info, log_error, log_debug
 from services.detectors.beat_transformer_detector import BeatTransformerDetectorService
 from services.detectors.madmom_detector import MadmomDetectorService
@@ -240,8 +241,12 @@ class BeatDetectionService:
                     elif isinstance(time_sig, (int, float)):
                         beats_per_measure = int(time_sig)
 
-                    beats = result.get('beats') or []
-                    downbeats = result.get('downbeats') or []
+                    beats = result.get('beats')
+                    downbeats = result.get('downbeats')
+                    if beats is None:
+                        beats = []
+                    if downbeats is None:
+                        downbeats = []
                     measure_counts = []  # type: List[int]
 
                     # Skip redundant grouping for Madmom heuristic candidates (downbeats derived deterministically)
@@ -251,7 +256,7 @@ class BeatDetectionService:
                         result.get('downbeat_candidates_meta', {}).get('strategy') == 'heuristic_slices_from_beats'
                     )
 
-                    if not is_madmom_heuristic and isinstance(beats, list) and isinstance(downbeats, list) and len(downbeats) >= 2:
+                    if not is_madmom_heuristic and isinstance(beats, (list, np.ndarray)) and isinstance(downbeats, (list, np.ndarray)) and len(downbeats) >= 2:
                         # Two-pointer O(n) measure counting since beats/downbeats are sorted
                         # Advance a beat index across the beats list while walking consecutive downbeat windows [start, end)
                         bi = 0
@@ -82,8 +82,8 @@ class BeatTransformerDetectorService:
             Dict containing normalized beat detection results:
             {
                 "success": bool,
-                "beats": List[float],           # Beat positions in seconds
-                "downbeats": List[float],       # Downbeat positions in seconds
+                "beats": np.ndarray,            # Beat positions in seconds
+                "downbeats": np.ndarray,        # Downbeat positions in seconds
                 "total_beats": int,
                 "total_downbeats": int,
                 "bpm": float,
@@ -82,7 +82,7 @@ class LibrosaDetectorService:
 
             # Load audio
             y, sr = librosa.load(file_path, sr=None)
-            duration = librosa.get_duration(y=y, sr=sr)
+            duration = y.shape[-1] / sr
 
             # Detect beats
             tempo, beats = librosa.beat.beat_track(y=y, sr=sr)
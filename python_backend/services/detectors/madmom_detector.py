@@ -108,8 +108,7 @@ class MadmomDetectorService:
                 bpm = 60.0 / median_interval if median_interval > 0 else 120.0
 
             # Get audio duration
-            y, sr = librosa.load(file_path, sr=None)
-            duration = librosa.get_duration(y=y, sr=sr)
+            duration = librosa.get_duration(path=file_path)
 
             # Time signature will be selected on the frontend via heuristic comparison of candidates.
             # Keep a backward-compatible placeholder; default to 4/4 here.